@@ -1,343 +1,496 @@
 import pandas as pd
-import json
+import numpy as np
+import orjson
+import os
 import re
 from datetime import datetime
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import List, Dict, Any, Tuple, Set, Optional, Iterator
 
-def parse_age_range(ages_min: int, ages_min_month: int, ages_min_week: int, 
-                   ages_max: int, ages_max_month: int, ages_max_week: int) -> str:
-    """Parse age range from separate age fields"""
-    try:
-        # Handle minimum age
-        min_age_str = ""
-        if pd.notna(ages_min) and ages_min > 0:
-            min_age_str = str(int(ages_min))
-            if pd.notna(ages_min_month) and ages_min_month > 0:
-                min_age_str += f".{int(ages_min_month)}"
-        
-        # Handle maximum age
-        max_age_str = ""
-        if pd.notna(ages_max) and ages_max > 0:
-            max_age_str = str(int(ages_max))
-            if pd.notna(ages_max_month) and ages_max_month > 0:
-                max_age_str += f".{int(ages_max_month)}"
-        
-        # Create age range string
-        if min_age_str and max_age_str:
-            return f"{min_age_str}-{max_age_str} years"
-        elif min_age_str:
-            return f"{min_age_str}+ years"
-        elif max_age_str:
-            return f"Up to {max_age_str} years"
-        else:
-            return "All ages"
-            
-    except:
-        return "All ages"
+# Number of CSV rows converted at a time
+CHUNK_SIZE = 5000
 
-def parse_location(activity_location: str) -> Dict[str, Any]:
-    """Parse location string into structured location object"""
-    location = {
-        "name": "",
-        "address": "",
-        "coordinates": {
-            "type": "Point",
-            "coordinates": [-122.3321, 47.6062]  # Default Seattle coordinates
-        }
-    }
+ORGANIZATION_NAME = "Seattle Parks and Recreation"
+
+# Default Seattle coordinates, shared by every activity location
+DEFAULT_COORDINATES = {
+    "type": "Point",
+    "coordinates": [-122.3321, 47.6062]
+}
+
+# WeekDays tokens and the day names they map to
+DAY_MAPPING = {
+    'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'Th': 'Thursday',
+    'F': 'Friday', 'S': 'Saturday', 'Su': 'Sunday'
+}
+
+# Matches a whole WeekDays token from DAY_MAPPING, delimited by commas or whitespace
+DAY_TOKEN_RE = re.compile(r'(?<![^,\s])(?:Th|Su|M|T|W|F|S)(?![^,\s])')
+
+# CSV columns used by the conversion, with pinned dtypes so unused columns are never read
+CSV_DTYPES = {
+    'Activity_ID': 'Int64',
+    'ActivityNumber': 'Int64',
+    'ActivityName': 'string',
+    'SeasonName': 'string',
+    'ChildSeasonName': 'string',
+    'CategoryName': 'string',
+    'OtherCategoryName': 'string',
+    'EnrollMin': 'Int64',
+    'EnrollMax': 'string',
+    'NumberEnrolled': 'Int64',
+    'BeginningDate': 'string',
+    'EndingDate': 'string',
+    'StartingTime': 'string',
+    'EndingTime': 'string',
+    'AgesMin': 'Int64',
+    'AgesMinMonth': 'Int64',
+    'AgesMax': 'Int64',
+    'AgesMaxMonth': 'Int64',
+    'WeekDays': 'string',
+    'PrimaryInstructorName': 'string',
+    'NumberOfHours': 'float64',
+    'NumberOfDates': 'Int64',
+    'ActivityLocation': 'string',
+    'KeyFeesTotal': 'float64',
+    'OtherFeesTotal': 'float64',
+    'FeeSummary': 'string',
+    'Description': 'string',
+    'PublicURL': 'string'
+}
+
+# Category tags and the CategoryName keywords that trigger them
+CATEGORY_PATTERNS = {
+    'education': 'academic|career',
+    'aquatics': 'aquatic',
+    'arts': 'art|craft',
+    'sports': 'athletic|sport',
+    'boating': 'boat',
+    'camps': 'camp',
+    'fitness': 'fitness|health|wellness',
+    'outdoor': 'nature|environment',
+    'performing_arts': 'performing|dance',
+    'martial_arts': 'martial'
+}
+
+# Demographic tags and the OtherCategoryName keywords that trigger them
+DEMOGRAPHIC_PATTERNS = {
+    'adult': 'adult',
+    'senior': 'senior',
+    'teen': 'teen',
+    'youth': 'youth',
+    'family': 'family',
+    'toddler': 'toddler|early childhood'
+}
+
+def _format_age(ages: pd.Series, months: pd.Series) -> pd.Series:
+    """Format an age column like "7" or "7.6", with empty strings where no age is set"""
+    ages = ages.fillna(0).astype(int)
+    months = months.fillna(0).astype(int)
+    has_age = ages > 0
+    age_str = ages.astype(str) + np.where(months > 0, '.' + months.astype(str), '')
+    return age_str.where(has_age, '')
+
+def parse_age_range(ages_min: pd.Series, ages_min_month: pd.Series,
+                    ages_max: pd.Series, ages_max_month: pd.Series) -> np.ndarray:
+    """Parse age range from separate age columns"""
+    min_age_str = _format_age(ages_min, ages_min_month)
+    max_age_str = _format_age(ages_max, ages_max_month)
+    has_min = min_age_str != ''
+    has_max = max_age_str != ''
     
-    if pd.isna(activity_location) or not activity_location:
-        return location
+    return np.select(
+        [has_min & has_max, has_min, has_max],
+        [min_age_str + '-' + max_age_str + ' years', min_age_str + '+ years', 'Up to ' + max_age_str + ' years'],
+        default='All ages'
+    )
+
+def parse_location(activity_location: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse location column into location name and address columns"""
+    activity_location = activity_location.fillna('').astype(str)
     
     # Split on " at " to separate room/facility from building
-    if " at " in activity_location:
-        parts = activity_location.split(" at ", 1)
-        room_info = parts[0].strip()
-        building_info = parts[1].strip()
-        
-        location["name"] = building_info
-        location["address"] = f"{room_info}, {building_info}, Seattle, WA"
-    else:
-        location["name"] = activity_location.strip()
-        location["address"] = f"{activity_location.strip()}, Seattle, WA"
+    parts = activity_location.str.split(' at ', n=1, expand=True).reindex(columns=[0, 1])
+    # astype(str) keeps the columns textual even when the chunk is empty
+    room_info = parts[0].fillna('').astype(str).str.strip()
+    building_info = parts[1].fillna('').astype(str).str.strip()
+    has_building = parts[1].notna()
+    is_empty = activity_location == ''
     
-    return location
+    names = np.select([is_empty, has_building], ['', building_info], default=room_info)
+    addresses = np.select(
+        [is_empty, has_building],
+        ['', room_info + ', ' + building_info + ', Seattle, WA'],
+        default=room_info + ', Seattle, WA'
+    )
+    
+    return names, addresses
 
-def parse_dates(beginning_date: str, ending_date: str) -> Dict[str, str]:
-    """Parse date strings into structured date object"""
-    dates = {
-        "start_date": "",
-        "end_date": ""
-    }
+def parse_dates(beginning_dates: pd.Series, ending_dates: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Parse date columns like "1/23/2025" into start and end datetime columns"""
+    start_dates = pd.to_datetime(beginning_dates, format='%m/%d/%Y', errors='coerce')
+    end_dates = pd.to_datetime(ending_dates, format='%m/%d/%Y', errors='coerce')
     
-    try:
-        if pd.notna(beginning_date) and beginning_date:
-            # Parse date format like "1/23/2025"
-            start_dt = pd.to_datetime(beginning_date)
-            dates["start_date"] = start_dt.strftime("%Y-%m-%d")
-        
-        if pd.notna(ending_date) and ending_date:
-            end_dt = pd.to_datetime(ending_date)
-            dates["end_date"] = end_dt.strftime("%Y-%m-%d")
-        elif dates["start_date"]:
-            # If no end date, use start date
-            dates["end_date"] = dates["start_date"]
-            
-    except:
-        pass
+    # If no end date, use start date
+    end_dates = end_dates.fillna(start_dates)
     
-    return dates
+    return start_dates, end_dates
 
-def parse_schedule(week_days: str, starting_time: str, ending_time: str) -> Dict[str, Any]:
-    """Parse schedule information into structured schedule object"""
-    schedule = {
-        "days": [],
-        "times": ""
-    }
-    
-    # Parse days
-    if pd.notna(week_days) and week_days:
-        day_mapping = {
-            'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'Th': 'Thursday',
-            'F': 'Friday', 'S': 'Saturday', 'Su': 'Sunday'
-        }
-        
-        # Split by common separators
-        day_parts = re.split(r'[,\s]+', week_days.strip())
-        for day_part in day_parts:
-            if day_part in day_mapping:
-                schedule["days"].append(day_mapping[day_part])
+def parse_schedule(week_days: pd.Series, starting_time: pd.Series, ending_time: pd.Series) -> Tuple[List[List[str]], np.ndarray]:
+    """Parse schedule columns into per-row day lists and time strings"""
+    # Find whole day tokens delimited by commas or whitespace
+    day_tokens = week_days.fillna('').astype(str).str.findall(DAY_TOKEN_RE)
+    days = [[DAY_MAPPING[token] for token in tokens] for tokens in day_tokens]
     
     # Parse times
-    if pd.notna(starting_time) and pd.notna(ending_time) and starting_time and ending_time:
-        schedule["times"] = f"{starting_time} - {ending_time}"
-    elif pd.notna(starting_time) and starting_time:
-        schedule["times"] = starting_time
+    starting_time = starting_time.fillna('').astype(str)
+    ending_time = ending_time.fillna('').astype(str)
+    has_start = starting_time != ''
+    times = np.select(
+        [has_start & (ending_time != ''), has_start],
+        [starting_time + ' - ' + ending_time, starting_time],
+        default=''
+    )
     
-    return schedule
+    return days, times
 
-def parse_cost(key_fees_total: float, other_fees_total: float, fee_summary: str) -> str:
-    """Parse cost information"""
-    try:
-        total_cost = 0
-        if pd.notna(key_fees_total):
-            total_cost += key_fees_total
-        if pd.notna(other_fees_total):
-            total_cost += other_fees_total
-        
-        if total_cost > 0:
-            return f"${total_cost:.2f}"
-        elif pd.notna(fee_summary) and fee_summary:
-            if "Free" in fee_summary:
-                return "Free"
-            else:
-                return fee_summary
-        else:
-            return "Free"
-            
-    except:
-        return "Contact for pricing"
+def _classify_cost(cost_text: pd.Series) -> np.ndarray:
+    """Label cost strings as free, paid or unknown for the summary"""
+    cost_text = cost_text.str.lower()
+    is_free = cost_text.str.contains('free', regex=False) | cost_text.str.contains('$0', regex=False)
+    return np.select([is_free, cost_text.str.contains('$', regex=False)], ['free', 'paid'], default='unknown')
 
-def generate_tags(row: pd.Series) -> Dict[str, List[str]]:
-    """Generate structured tags based on activity data"""
-    tags = {
-        "categories": [],
-        "demographics": [],
-        "accessibility": [],
-        "program_type": []
-    }
+def parse_cost(key_fees_total: pd.Series, other_fees_total: pd.Series,
+               fee_summary: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse cost information for every row, along with its free/paid/unknown label"""
+    total_cost = key_fees_total.fillna(0).astype(float) + other_fees_total.fillna(0).astype(float)
+    fee_summary = fee_summary.fillna('').astype(str)
+    
+    # astype(str) keeps the column textual even when the chunk is empty
+    paid = '$' + total_cost.map('{:.2f}'.format).astype(str)
+    conditions = [total_cost > 0, fee_summary.str.contains('Free', regex=False), fee_summary != '']
+    
+    costs = np.select(conditions, [paid, 'Free', fee_summary], default='Free')
+    cost_classes = np.select(
+        conditions,
+        [_classify_cost(paid), 'free', _classify_cost(fee_summary)],
+        default='free'
+    )
     
+    return costs, cost_classes
+
+def generate_tags(df: pd.DataFrame) -> Tuple[List[List[str]], List[List[str]], List[List[str]]]:
+    """Generate category, demographic and program type tag columns for every activity"""
     # Categories based on CategoryName
-    category_name = str(row.get('CategoryName', '')).lower()
-    if 'academic' in category_name or 'career' in category_name:
-        tags["categories"].append('education')
-    if 'aquatic' in category_name:
-        tags["categories"].append('aquatics')
-    if 'art' in category_name or 'craft' in category_name:
-        tags["categories"].append('arts')
-    if 'athletic' in category_name or 'sport' in category_name:
-        tags["categories"].append('sports')
-    if 'boat' in category_name:
-        tags["categories"].append('boating')
-    if 'camp' in category_name:
-        tags["categories"].append('camps')
-    if 'fitness' in category_name or 'health' in category_name or 'wellness' in category_name:
-        tags["categories"].append('fitness')
-    if 'nature' in category_name or 'environment' in category_name:
-        tags["categories"].append('outdoor')
-    if 'performing' in category_name or 'dance' in category_name:
-        tags["categories"].append('performing_arts')
-    if 'martial' in category_name:
-        tags["categories"].append('martial_arts')
+    category_name = df['CategoryName'].fillna('').astype(str).str.lower()
+    category_masks = {
+        tag: category_name.str.contains(pattern, regex=True).tolist()
+        for tag, pattern in CATEGORY_PATTERNS.items()
+    }
     
     # Demographics based on OtherCategoryName and age ranges
-    other_category = str(row.get('OtherCategoryName', '')).lower()
-    if 'adult' in other_category:
-        tags["demographics"].append('adult')
-    if 'senior' in other_category:
-        tags["demographics"].append('senior')
-    if 'teen' in other_category:
-        tags["demographics"].append('teen')
-    if 'youth' in other_category:
-        tags["demographics"].append('youth')
-    if 'family' in other_category:
-        tags["demographics"].append('family')
-    if 'toddler' in other_category or 'early childhood' in other_category:
-        tags["demographics"].append('toddler')
-    
-    # Age-based demographics
-    ages_min = row.get('AgesMin', 0)
-    ages_max = row.get('AgesMax', 0)
-    if pd.notna(ages_min) and ages_min > 0:
-        if ages_min < 6:
-            tags["demographics"].append('early_childhood')
-        elif ages_min < 13:
-            tags["demographics"].append('youth')
-        elif ages_min < 18:
-            tags["demographics"].append('teen')
-        elif ages_min >= 55:
-            tags["demographics"].append('senior')
-        else:
-            tags["demographics"].append('adult')
-    
-    # Program type based on Type and other indicators
-    activity_type = str(row.get('Type', '')).lower()
-    if 'drop' in str(row.get('ActivityName', '')).lower():
-        tags["program_type"].append('drop-in')
-    else:
-        tags["program_type"].append('registration')
+    other_category = df['OtherCategoryName'].fillna('').astype(str).str.lower()
+    demographic_masks = {
+        tag: other_category.str.contains(pattern, regex=True).tolist()
+        for tag, pattern in DEMOGRAPHIC_PATTERNS.items()
+    }
+    
+    # Age-based demographics (a plain ndarray, as np.select rejects nullable boolean masks)
+    ages_min = df['AgesMin'].fillna(0).to_numpy(dtype='int64')
+    age_demographics = np.select(
+        [ages_min <= 0, ages_min < 6, ages_min < 13, ages_min < 18, ages_min >= 55],
+        ['', 'early_childhood', 'youth', 'teen', 'senior'],
+        default='adult'
+    ).tolist()
+    
+    # Program type based on activity name
+    is_drop_in = df['ActivityName'].fillna('').astype(str).str.lower().str.contains('drop', regex=False).tolist()
     
     # Cost-based tags
-    key_fees = row.get('KeyFeesTotal', 0)
-    other_fees = row.get('OtherFeesTotal', 0)
-    if pd.isna(key_fees) or key_fees == 0:
-        if pd.isna(other_fees) or other_fees == 0:
-            tags["program_type"].append('free')
+    is_free = ((df['KeyFeesTotal'].fillna(0) == 0) & (df['OtherFeesTotal'].fillna(0) == 0)).tolist()
     
-    # Remove duplicates
-    for category in tags:
-        tags[category] = list(set(tags[category]))
+    categories = []
+    demographics = []
+    program_types = []
+    for i in range(len(df)):
+        row_demographics = [tag for tag, mask in demographic_masks.items() if mask[i]]
+        # Each mask fires at most once, so only the age bucket can repeat a tag
+        if age_demographics[i] and age_demographics[i] not in row_demographics:
+            row_demographics.append(age_demographics[i])
+        row_program_types = ['drop-in' if is_drop_in[i] else 'registration']
+        if is_free[i]:
+            row_program_types.append('free')
+        
+        categories.append([tag for tag, mask in category_masks.items() if mask[i]])
+        demographics.append(row_demographics)
+        program_types.append(row_program_types)
     
-    return tags
+    return categories, demographics, program_types
+
+def serialize_activity(activity: Dict[str, Any]) -> bytes:
+    """Serialize one activity as an element of a 2-space indented JSON array"""
+    return b'  ' + orjson.dumps(activity, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+
+def _text_column(df: pd.DataFrame, column: str) -> List[str]:
+    """Return a column as stripped strings, with missing values as empty strings"""
+    return df[column].fillna('').astype(str).str.strip().tolist()
+
+def _nullable_column(df: pd.DataFrame, column: str, dtype: str, default: Any = None) -> List[Any]:
+    """Return a column as Python scalars of the given dtype, with missing values as default"""
+    return df[column].astype(dtype).to_numpy(dtype=object, na_value=default).tolist()
 
-def convert_csv_to_mongodb_schema(csv_file_path: str, output_file_path: str = 'activities_mongodb.json'):
-    """Convert CSV to MongoDB schema format"""
+@dataclass
+class SummaryAccumulator:
+    """Running summary statistics, updated one chunk at a time"""
+    total_activities: int = 0
+    categories: Set[str] = field(default_factory=set)
+    demographics: Set[str] = field(default_factory=set)
+    program_types: Set[str] = field(default_factory=set)
+    free_count: int = 0
+    paid_count: int = 0
+    unknown_count: int = 0
+    location_names: Set[str] = field(default_factory=set)
+    earliest: Optional[pd.Timestamp] = None
+    latest: Optional[pd.Timestamp] = None
     
-    # Read CSV file
-    print(f"Reading CSV file: {csv_file_path}")
-    df = pd.read_csv(csv_file_path)
-    
-    print(f"Processing {len(df)} activities...")
-    
-    activities = []
-    
-    for index, row in df.iterrows():
-        # Create MongoDB document
-        activity = {
-            "organization_name": "Seattle Parks and Recreation",
-            "program_description": str(row.get('Description', '')).strip() if pd.notna(row.get('Description')) else "",
-            "activity_name": str(row.get('ActivityName', '')).strip() if pd.notna(row.get('ActivityName')) else "",
-            "activity_description": str(row.get('Description', '')).strip() if pd.notna(row.get('Description')) else "",
-            "location": parse_location(row.get('ActivityLocation')),
-            "age_range": parse_age_range(
-                row.get('AgesMin'), row.get('AgesMinMonth'), row.get('AgesMinWeek'),
-                row.get('AgesMax'), row.get('AgesMaxMonth'), row.get('AgesMaxWeek')
-            ),
-            "dates": parse_dates(row.get('BeginningDate'), row.get('EndingDate')),
-            "schedule": parse_schedule(row.get('WeekDays'), row.get('StartingTime'), row.get('EndingTime')),
-            "cost": parse_cost(row.get('KeyFeesTotal'), row.get('OtherFeesTotal'), row.get('FeeSummary')),
-            "url": str(row.get('PublicURL', '')).strip() if pd.notna(row.get('PublicURL')) else "",
-            "tags": generate_tags(row),
-            "last_updated": {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "source_url": "ParkCatalog.csv"
+    def merge(self, other: 'SummaryAccumulator'):
+        """Fold another chunk's statistics into this one"""
+        self.total_activities += other.total_activities
+        self.categories |= other.categories
+        self.demographics |= other.demographics
+        self.program_types |= other.program_types
+        self.free_count += other.free_count
+        self.paid_count += other.paid_count
+        self.unknown_count += other.unknown_count
+        self.location_names |= other.location_names
+        if other.earliest is not None and (self.earliest is None or other.earliest < self.earliest):
+            self.earliest = other.earliest
+        if other.latest is not None and (self.latest is None or other.latest > self.latest):
+            self.latest = other.latest
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """Build the summary document saved next to the activities"""
+        return {
+            "total_activities": self.total_activities,
+            "organizations": [ORGANIZATION_NAME] if self.total_activities else [],
+            "categories_found": sorted(self.categories),
+            "demographics_found": sorted(self.demographics),
+            "program_types_found": sorted(self.program_types),
+            "cost_distribution": {
+                "free": self.free_count,
+                "paid": self.paid_count,
+                "unknown": self.unknown_count
+            },
+            "location_count": len(self.location_names - {''}),
+            "date_range": {
+                "earliest": self.earliest.strftime('%Y-%m-%d') if self.earliest is not None else None,
+                "latest": self.latest.strftime('%Y-%m-%d') if self.latest is not None else None
             }
         }
+
+@dataclass
+class ActivityColumns:
+    """Parsed activity fields for one chunk, kept as parallel columns until serialization"""
+    descriptions: List[str]
+    activity_names: List[str]
+    urls: List[str]
+    location_names: List[str]
+    location_addresses: List[str]
+    age_ranges: List[str]
+    start_dates: pd.Series
+    end_dates: pd.Series
+    schedule_days: List[List[str]]
+    schedule_times: List[str]
+    costs: List[str]
+    cost_classes: np.ndarray
+    categories: List[List[str]]
+    demographics: List[List[str]]
+    program_types: List[List[str]]
+    csv_data: Dict[str, List[Any]]
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'ActivityColumns':
+        """Parse every field of a chunk of CSV rows once per column"""
+        location_names, location_addresses = parse_location(df['ActivityLocation'])
+        schedule_days, schedule_times = parse_schedule(df['WeekDays'], df['StartingTime'], df['EndingTime'])
+        start_dates, end_dates = parse_dates(df['BeginningDate'], df['EndingDate'])
+        costs, cost_classes = parse_cost(df['KeyFeesTotal'], df['OtherFeesTotal'], df['FeeSummary'])
+        categories, demographics, program_types = generate_tags(df)
         
-        # Add additional fields from CSV for reference
-        activity["_csv_data"] = {
-            "activity_id": int(row.get('Activity_ID')) if pd.notna(row.get('Activity_ID')) else None,
-            "activity_number": int(row.get('ActivityNumber')) if pd.notna(row.get('ActivityNumber')) else None,
-            "season_name": str(row.get('SeasonName', '')).strip() if pd.notna(row.get('SeasonName')) else "",
-            "child_season_name": str(row.get('ChildSeasonName', '')).strip() if pd.notna(row.get('ChildSeasonName')) else "",
-            "category_name": str(row.get('CategoryName', '')).strip() if pd.notna(row.get('CategoryName')) else "",
-            "other_category_name": str(row.get('OtherCategoryName', '')).strip() if pd.notna(row.get('OtherCategoryName')) else "",
-            "primary_instructor": str(row.get('PrimaryInstructorName', '')).strip() if pd.notna(row.get('PrimaryInstructorName')) else "",
-            "enrollment_min": int(row.get('EnrollMin')) if pd.notna(row.get('EnrollMin')) else None,
-            "enrollment_max": str(row.get('EnrollMax', '')).strip() if pd.notna(row.get('EnrollMax')) else "",
-            "number_enrolled": int(row.get('NumberEnrolled')) if pd.notna(row.get('NumberEnrolled')) else 0,
-            "number_of_hours": float(row.get('NumberOfHours')) if pd.notna(row.get('NumberOfHours')) else None,
-            "number_of_dates": int(row.get('NumberOfDates')) if pd.notna(row.get('NumberOfDates')) else None
-        }
+        return cls(
+            descriptions=_text_column(df, 'Description'),
+            activity_names=_text_column(df, 'ActivityName'),
+            urls=_text_column(df, 'PublicURL'),
+            location_names=location_names.tolist(),
+            location_addresses=location_addresses.tolist(),
+            age_ranges=parse_age_range(
+                df['AgesMin'], df['AgesMinMonth'], df['AgesMax'], df['AgesMaxMonth']
+            ).tolist(),
+            start_dates=start_dates,
+            end_dates=end_dates,
+            schedule_days=schedule_days,
+            schedule_times=schedule_times.tolist(),
+            costs=costs.tolist(),
+            cost_classes=cost_classes,
+            categories=categories,
+            demographics=demographics,
+            program_types=program_types,
+            # Additional fields from CSV for reference
+            csv_data={
+                "activity_id": _nullable_column(df, 'Activity_ID', 'Int64'),
+                "activity_number": _nullable_column(df, 'ActivityNumber', 'Int64'),
+                "season_name": _text_column(df, 'SeasonName'),
+                "child_season_name": _text_column(df, 'ChildSeasonName'),
+                "category_name": _text_column(df, 'CategoryName'),
+                "other_category_name": _text_column(df, 'OtherCategoryName'),
+                "primary_instructor": _text_column(df, 'PrimaryInstructorName'),
+                "enrollment_min": _nullable_column(df, 'EnrollMin', 'Int64'),
+                "enrollment_max": _text_column(df, 'EnrollMax'),
+                "number_enrolled": _nullable_column(df, 'NumberEnrolled', 'Int64', default=0),
+                "number_of_hours": _nullable_column(df, 'NumberOfHours', 'float64'),
+                "number_of_dates": _nullable_column(df, 'NumberOfDates', 'Int64')
+            }
+        )
+    
+    def summarize(self) -> SummaryAccumulator:
+        """Compute summary statistics directly from the columns"""
+        stats = SummaryAccumulator(
+            total_activities=len(self.descriptions),
+            categories=set(chain.from_iterable(self.categories)),
+            demographics=set(chain.from_iterable(self.demographics)),
+            program_types=set(chain.from_iterable(self.program_types)),
+            location_names=set(self.location_names)
+        )
         
-        activities.append(activity)
+        # Cost distribution
+        classes, counts = np.unique(self.cost_classes, return_counts=True)
+        cost_distribution = dict(zip(classes.tolist(), counts.tolist()))
+        stats.free_count = cost_distribution.get('free', 0)
+        stats.paid_count = cost_distribution.get('paid', 0)
+        stats.unknown_count = cost_distribution.get('unknown', 0)
         
-        # Progress indicator
-        if (index + 1) % 100 == 0:
-            print(f"Processed {index + 1} activities...")
+        # Date range
+        if self.start_dates.notna().any():
+            stats.earliest = self.start_dates.min()
+            stats.latest = self.start_dates.max()
+        
+        return stats
     
-    # Save to JSON file
-    print(f"Saving to {output_file_path}...")
-    with open(output_file_path, 'w', encoding='utf-8') as f:
-        json.dump(activities, f, indent=2, ensure_ascii=False)
+    def to_documents(self) -> Iterator[Dict[str, Any]]:
+        """Zip the columns into MongoDB documents, one row at a time"""
+        start_dates = self.start_dates.dt.strftime('%Y-%m-%d').fillna('').tolist()
+        end_dates = self.end_dates.dt.strftime('%Y-%m-%d').fillna('').tolist()
+        csv_fields = list(self.csv_data)
+        
+        # Every document shares the same last_updated object
+        last_updated = {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "source_url": "ParkCatalog.csv"
+        }
+        
+        rows = zip(
+            self.descriptions, self.activity_names, self.urls,
+            self.location_names, self.location_addresses, self.age_ranges,
+            start_dates, end_dates, self.schedule_days, self.schedule_times, self.costs,
+            self.categories, self.demographics, self.program_types,
+            zip(*self.csv_data.values())
+        )
+        
+        for (description, activity_name, url, location_name, location_address, age_range,
+             start_date, end_date, days, times, cost,
+             categories, demographics, program_types, csv_values) in rows:
+            yield {
+                "organization_name": ORGANIZATION_NAME,
+                "program_description": description,
+                "activity_name": activity_name,
+                "activity_description": description,
+                "location": {
+                    "name": location_name,
+                    "address": location_address,
+                    "coordinates": DEFAULT_COORDINATES
+                },
+                "age_range": age_range,
+                "dates": {"start_date": start_date, "end_date": end_date},
+                "schedule": {"days": days, "times": times},
+                "cost": cost,
+                "url": url,
+                "tags": {
+                    "categories": categories,
+                    "demographics": demographics,
+                    "accessibility": [],
+                    "program_type": program_types
+                },
+                "last_updated": last_updated,
+                "_csv_data": dict(zip(csv_fields, csv_values))
+            }
+
+def process_chunk(df: pd.DataFrame) -> Tuple[List[bytes], SummaryAccumulator]:
+    """Convert one chunk of CSV rows to serialized MongoDB documents and their summary statistics"""
+    columns = ActivityColumns.from_frame(df)
+    return [serialize_activity(activity) for activity in columns.to_documents()], columns.summarize()
+
+def convert_csv_to_mongodb_schema(csv_file_path: str, output_file_path: str = 'activities_mongodb.json',
+                                  chunk_size: int = CHUNK_SIZE, max_workers: Optional[int] = None):
+    """Convert CSV to MongoDB schema format, streaming chunks of rows to the output file"""
     
-    print(f"Conversion completed! Saved {len(activities)} activities to {output_file_path}")
+    # Read CSV file in chunks so memory stays bounded by chunk_size
+    print(f"Reading CSV file: {csv_file_path}")
+    chunks = pd.read_csv(csv_file_path, usecols=list(CSV_DTYPES), dtype=CSV_DTYPES, chunksize=chunk_size)
     
-    # Generate summary statistics
-    summary = {
-        "total_activities": len(activities),
-        "organizations": list(set([a["organization_name"] for a in activities])),
-        "categories_found": [],
-        "demographics_found": [],
-        "program_types_found": [],
-        "cost_distribution": {"free": 0, "paid": 0, "unknown": 0},
-        "location_count": len(set([a["location"]["name"] for a in activities if a["location"]["name"]])),
-        "date_range": {
-            "earliest": None,
-            "latest": None
-        }
-    }
+    stats = SummaryAccumulator()
+    sample_activity = None
     
-    # Collect tag statistics
-    all_categories = set()
-    all_demographics = set()
-    all_program_types = set()
-    all_dates = []
+    workers = max_workers or os.cpu_count() or 1
     
-    for activity in activities:
-        all_categories.update(activity["tags"]["categories"])
-        all_demographics.update(activity["tags"]["demographics"])
-        all_program_types.update(activity["tags"]["program_type"])
+    print(f"Saving to {output_file_path}...")
+    with open(output_file_path, 'wb') as f, ProcessPoolExecutor(max_workers=workers) as executor:
+        def write_chunk(future):
+            nonlocal sample_activity
+            records, chunk_stats = future.result()
+            
+            # Save to JSON file, one record at a time
+            for index, record in enumerate(records):
+                f.write(b',\n' if stats.total_activities or index else b'\n')
+                f.write(record)
+            
+            if sample_activity is None and records:
+                sample_activity = orjson.loads(records[0])
+            
+            stats.merge(chunk_stats)
+            
+            # Progress indicator
+            print(f"Processed {stats.total_activities} activities...")
         
-        # Cost distribution
-        cost = activity["cost"].lower()
-        if "free" in cost or "$0" in cost:
-            summary["cost_distribution"]["free"] += 1
-        elif "$" in cost:
-            summary["cost_distribution"]["paid"] += 1
-        else:
-            summary["cost_distribution"]["unknown"] += 1
+        # Convert chunks in worker processes, writing them back in CSV order and
+        # keeping only a couple of chunks per worker in flight
+        max_pending = 2 * workers
+        pending = deque()
         
-        # Date range
-        if activity["dates"]["start_date"]:
-            all_dates.append(activity["dates"]["start_date"])
+        f.write(b'[')
+        for df in chunks:
+            pending.append(executor.submit(process_chunk, df))
+            if len(pending) >= max_pending:
+                write_chunk(pending.popleft())
+        while pending:
+            write_chunk(pending.popleft())
+        f.write(b'\n]' if stats.total_activities else b']')
     
-    summary["categories_found"] = sorted(list(all_categories))
-    summary["demographics_found"] = sorted(list(all_demographics))
-    summary["program_types_found"] = sorted(list(all_program_types))
+    print(f"Conversion completed! Saved {stats.total_activities} activities to {output_file_path}")
     
-    if all_dates:
-        summary["date_range"]["earliest"] = min(all_dates)
-        summary["date_range"]["latest"] = max(all_dates)
+    # Generate summary statistics
+    summary = stats.to_summary()
     
     # Save summary
     summary_file = output_file_path.replace('.json', '_summary.json')
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     
     print(f"Summary saved to {summary_file}")
     
-    return activities, summary
+    return sample_activity, summary
 
 def main():
     """Main execution function"""
@@ -345,7 +498,7 @@ def main():
     output_file = 'seattle_parks_activities_mongodb.json'
     
     try:
-        activities, summary = convert_csv_to_mongodb_schema(csv_file, output_file)
+        sample_activity, summary = convert_csv_to_mongodb_schema(csv_file, output_file)
         
         print(f"\n{'='*50}")
         print("CONVERSION SUMMARY")
@@ -359,9 +512,10 @@ def main():
         print(f"Program types found: {len(summary['program_types_found'])}")
         
         # Show sample activity
-        if activities:
+        if sample_activity:
             print(f"\nSample activity (first record):")
-            print(json.dumps(activities[0], indent=2)[:1000] + "..." if len(json.dumps(activities[0], indent=2)) > 1000 else json.dumps(activities[0], indent=2))
+            sample = orjson.dumps(sample_activity, option=orjson.OPT_INDENT_2).decode('utf-8')
+            print(sample[:1000] + "..." if len(sample) > 1000 else sample)
         
     except Exception as e:
         print(f"Error during conversion: {e}")
@@ -1,9 +1,168 @@
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import ahocorasick
+import lxml.html
+import orjson
+import calendar
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+# Date parsing patterns, e.g. "August 2, 2025", "August 2 - 3, 2025", "August 2 - Sept. 1, 2025"
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+_PARENTHESES_RE = re.compile(r'\([^)]*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SINGLE_DATE_RE = re.compile(r'([A-Za-z]+\.?)\s+(\d{1,2}),?\s*(\d{4})')
+_SAME_MONTH_RE = re.compile(r'([A-Za-z]+\.?)\s+(\d{1,2})\s*-\s*(\d{1,2}),?\s*(\d{4})')
+_CROSS_MONTH_RE = re.compile(r'([A-Za-z]+\.?)\s+(\d{1,2})\s*-\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s*(\d{4})')
+
+# Month tokens captured by the date patterns, e.g. "August", "Aug", "Aug.", "Sept."
+_MONTH_NAMES = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+                'august', 'september', 'october', 'november', 'december')
+_MONTH_LOOKUP = {
+    **{name: number for number, name in enumerate(_MONTH_NAMES, 1)},
+    **{name[:3]: number for number, name in enumerate(_MONTH_NAMES, 1)},
+    **{name[:3] + '.': number for number, name in enumerate(_MONTH_NAMES, 1)},
+    'sept.': 9
+}
+
+# Dates that start each event block on the page
+_EVENT_DATE_RE = re.compile(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\.?\s+\d{1,2}(?:\s*-\s*\d{1,2})?,?\s+\d{4})')
+
+# Times like "7 p.m.", "9:30 PM"
+_TIME_RE = re.compile(r'(\d{1,2}(?::\d{2})?\s*[ap]\.?m\.?)', re.IGNORECASE)
+
+# Cost patterns, in priority order
+_COST_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$(\d+(?:\.\d{2})?)',
+    r'(free)',
+    r'(sold out)',
+    r'(admission[:\s]*\$?\d*)',
+    r'(no charge)',
+    r'(complimentary)'
+)]
+
+# Age patterns, in priority order
+_AGE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'age (\d+)[+\s]',
+    r'(\d+)[+\s]',
+    r'children age (\d+)',
+    r'for age (\d+)'
+)]
+
+# Bracketed event titles like "[Summer Concert]"
+_TITLE_RE = re.compile(r'\[([^\]]+)\]')
+
+# Keywords that trigger each tag, matched as substrings of the lowercased event text
+TAG_KEYWORDS = {
+    "categories": {
+        'music': ['concert', 'music', 'band', 'symphony', 'jazz', 'blues', 'rock', 'festival'],
+        'arts': ['art', 'gallery', 'exhibit', 'artist', 'painting', 'sculpture', 'craft'],
+        'theater': ['theater', 'theatre', 'play', 'performance', 'show', 'drama'],
+        'sports': ['sports', 'game', 'race', 'run', 'marathon', 'competition'],
+        'food': ['food', 'restaurant', 'taste', 'wine', 'beer', 'dining', 'culinary'],
+        'festival': ['festival', 'fest', 'celebration', 'fair', 'carnival'],
+        'outdoor': ['park', 'outdoor', 'hiking', 'garden', 'nature', 'beach'],
+        'family': ['family', 'kids', 'children', 'child'],
+        'nightlife': ['bar', 'club', 'nightlife', 'party', 'cocktail'],
+        'education': ['class', 'workshop', 'lesson', 'learn', 'educational'],
+        'community': ['community', 'neighborhood', 'local', 'volunteer']
+    },
+    "demographics": {
+        'family': ['kids', 'children', 'family', 'child'],
+        'adult': ['adult', '21+', 'age 21'],
+        'senior': ['senior', 'elder']
+    },
+    "program_type": {
+        'free': ['free', 'no charge', 'complimentary'],
+        'ticketed': ['$', 'ticket'],
+        'festival': ['festival', 'fair', 'celebration'],
+        'outdoor': ['outdoor', 'park']
+    }
+}
+
+def _build_tag_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton mapping every keyword to the tags it triggers"""
+    keyword_tags = {}
+    for bucket, tag_keywords in TAG_KEYWORDS.items():
+        for tag, keywords in tag_keywords.items():
+            for keyword in keywords:
+                keyword_tags.setdefault(keyword, []).append((bucket, tag))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in keyword_tags.items():
+        automaton.add_word(keyword, tags)
+    automaton.make_automaton()
+    return automaton
+
+_TAG_AUTOMATON = _build_tag_automaton()
+
+def _format_ymd(month_token: str, day: str, year: str) -> str:
+    """Format captured month/day/year groups as YYYY-MM-DD, or "" if they are not a valid date"""
+    month = _MONTH_LOOKUP.get(month_token.lower())
+    day = int(day)
+    if month is None or not 1 <= day <= calendar.monthrange(int(year), month)[1]:
+        return ""
+    return f"{year}-{month:02d}-{day:02d}"
+
+def _split_venue(venue_text: str) -> Tuple[str, str]:
+    """Split "Venue, street address" into a venue name and a Seattle address"""
+    name, sep, rest = venue_text.partition(',')
+    if sep:
+        return name.strip(), rest.strip() + ", Seattle, WA"
+    return venue_text, f"{venue_text}, Seattle, WA"
+
+def _response_encoding(response: requests.Response) -> str:
+    """Encoding of an HTML response: the HTTP charset if given, else UTF-8 if the body decodes as it, else a guess"""
+    if 'charset' in response.headers.get('content-type', '').lower():
+        return response.encoding
+    try:
+        response.content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return response.apparent_encoding
+
+@dataclass(slots=True)
+class Location:
+    """Venue name and address, with a GeoJSON point"""
+    name: str = ""
+    address: str = ""
+    coordinates: Dict[str, Any] = field(default_factory=lambda: {
+        "type": "Point",
+        "coordinates": [-122.3321, 47.6062]  # Default Seattle coordinates
+    })
+
+@dataclass(slots=True)
+class Schedule:
+    """Days of the week and time range"""
+    days: List[str] = field(default_factory=list)
+    times: str = ""
+
+@dataclass(slots=True)
+class Tags:
+    """Tag lists by bucket; all but accessibility are filled from TAG_KEYWORDS"""
+    categories: List[str] = field(default_factory=list)
+    demographics: List[str] = field(default_factory=list)
+    accessibility: List[str] = field(default_factory=list)
+    program_type: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class Event:
+    """One scraped event, serialized straight from its slots when saved"""
+    organization_name: str = "Events12 Seattle"
+    program_description: str = ""
+    activity_name: str = ""
+    activity_description: str = ""
+    location: Location = field(default_factory=Location)
+    age_range: str = ""
+    dates: Dict[str, str] = field(default_factory=lambda: {"start_date": "", "end_date": ""})
+    schedule: Schedule = field(default_factory=Schedule)
+    cost: str = ""
+    url: str = ""
+    tags: Tags = field(default_factory=Tags)
+    last_updated: Dict[str, str] = field(default_factory=dict)
 
 class Events12SeattleParser:
     def __init__(self):
@@ -12,16 +171,26 @@ class Events12SeattleParser:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        
+        # Pool connections and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def fetch_page_content(self, url: str = None) -> BeautifulSoup:
-        """Fetch page content and return BeautifulSoup object"""
+    def fetch_page_content(self, url: str = None) -> Optional[lxml.html.HtmlElement]:
+        """Fetch page content and return the parsed lxml tree"""
         if url is None:
             url = self.base_url
         
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            parser = lxml.html.HTMLParser(encoding=_response_encoding(response))
+            return lxml.html.fromstring(response.content, parser=parser)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
@@ -38,36 +207,36 @@ class Events12SeattleParser:
             # Examples: "August 2, 2025", "August 2 - 3, 2025", "August 2 - Sept. 1, 2025"
             
             # Extract year first
-            year_match = re.search(r'\b(20\d{2})\b', date_text)
+            year_match = _YEAR_RE.search(date_text)
             year = year_match.group(1) if year_match else "2025"
             
             # Clean up the date text
-            date_clean = re.sub(r'\([^)]*\)', '', date_text)  # Remove parentheses content
-            date_clean = re.sub(r'\s+', ' ', date_clean).strip()
+            date_clean = _PARENTHESES_RE.sub('', date_text)  # Remove parentheses content
+            date_clean = _WHITESPACE_RE.sub(' ', date_clean).strip()
             
             # Pattern for single date: "August 2, 2025"
-            single_date = re.search(r'([A-Za-z]+\.?)\s+(\d{1,2}),?\s*(\d{4})', date_clean)
+            single_date = _SINGLE_DATE_RE.search(date_clean)
             if single_date:
                 month, day, year = single_date.groups()
-                parsed_date = self.normalize_date(f"{month} {day}, {year}")
+                parsed_date = _format_ymd(month, day, year)
                 dates["start_date"] = parsed_date
                 dates["end_date"] = parsed_date
                 return dates
             
             # Pattern for date range within same month: "August 2 - 3, 2025"
-            same_month_range = re.search(r'([A-Za-z]+\.?)\s+(\d{1,2})\s*-\s*(\d{1,2}),?\s*(\d{4})', date_clean)
+            same_month_range = _SAME_MONTH_RE.search(date_clean)
             if same_month_range:
                 month, start_day, end_day, year = same_month_range.groups()
-                dates["start_date"] = self.normalize_date(f"{month} {start_day}, {year}")
-                dates["end_date"] = self.normalize_date(f"{month} {end_day}, {year}")
+                dates["start_date"] = _format_ymd(month, start_day, year)
+                dates["end_date"] = _format_ymd(month, end_day, year)
                 return dates
             
             # Pattern for cross-month range: "August 2 - Sept. 1, 2025"
-            cross_month = re.search(r'([A-Za-z]+\.?)\s+(\d{1,2})\s*-\s*([A-Za-z]+\.?)\s+(\d{1,2}),?\s*(\d{4})', date_clean)
+            cross_month = _CROSS_MONTH_RE.search(date_clean)
             if cross_month:
                 start_month, start_day, end_month, end_day, year = cross_month.groups()
-                dates["start_date"] = self.normalize_date(f"{start_month} {start_day}, {year}")
-                dates["end_date"] = self.normalize_date(f"{end_month} {end_day}, {year}")
+                dates["start_date"] = _format_ymd(start_month, start_day, year)
+                dates["end_date"] = _format_ymd(end_month, end_day, year)
                 return dates
             
         except Exception as e:
@@ -75,44 +244,9 @@ class Events12SeattleParser:
         
         return dates
 
-    def normalize_date(self, date_str: str) -> str:
-        """Normalize date string to YYYY-MM-DD format"""
-        try:
-            # Handle month abbreviations
-            month_abbrevs = {
-                'Jan.': 'January', 'Feb.': 'February', 'Mar.': 'March', 'Apr.': 'April',
-                'May.': 'May', 'Jun.': 'June', 'Jul.': 'July', 'Aug.': 'August',
-                'Sep.': 'September', 'Sept.': 'September', 'Oct.': 'October', 
-                'Nov.': 'November', 'Dec.': 'December'
-            }
-            
-            for abbrev, full in month_abbrevs.items():
-                date_str = date_str.replace(abbrev, full)
-            
-            # Try different date formats
-            formats = ['%B %d, %Y', '%b %d, %Y', '%m/%d/%Y', '%Y-%m-%d']
-            
-            for fmt in formats:
-                try:
-                    date_obj = datetime.strptime(date_str, fmt)
-                    return date_obj.strftime('%Y-%m-%d')
-                except ValueError:
-                    continue
-            
-            return ""
-        except:
-            return ""
-
-    def parse_location_and_neighborhood(self, location_text: str) -> Dict[str, Any]:
+    def parse_location_and_neighborhood(self, location_text: str) -> Location:
         """Parse location text into structured format"""
-        location = {
-            "name": "",
-            "address": "",
-            "coordinates": {
-                "type": "Point",
-                "coordinates": [-122.3321, 47.6062]  # Default Seattle coordinates
-            }
-        }
+        location = Location()
         
         if not location_text:
             return location
@@ -127,24 +261,15 @@ class Events12SeattleParser:
             if lines and '(' in lines[0] and 'miles' in lines[0]:
                 # Skip neighborhood line, use venue info
                 if len(lines) > 1:
-                    venue_line = lines[1].strip()
-                    location["name"] = venue_line.split(',')[0].strip() if ',' in venue_line else venue_line
-                    if ',' in venue_line:
-                        location["address"] = venue_line.split(',', 1)[1].strip() + ", Seattle, WA"
-                    else:
-                        location["address"] = f"{venue_line}, Seattle, WA"
+                    location.name, location.address = _split_venue(lines[1].strip())
             else:
                 # Use the location text as-is
-                location["name"] = location_text.split(',')[0].strip() if ',' in location_text else location_text
-                if ',' in location_text:
-                    location["address"] = location_text.split(',', 1)[1].strip() + ", Seattle, WA"
-                else:
-                    location["address"] = f"{location_text}, Seattle, WA"
+                location.name, location.address = _split_venue(location_text)
         
         except Exception as e:
             print(f"Error parsing location '{location_text}': {e}")
-            location["name"] = location_text
-            location["address"] = f"{location_text}, Seattle, WA"
+            location.name = location_text
+            location.address = f"{location_text}, Seattle, WA"
         
         return location
 
@@ -155,17 +280,7 @@ class Events12SeattleParser:
         
         try:
             # Extract time patterns
-            time_patterns = [
-                r'(\d{1,2}:\d{2}\s*[ap]\.?m\.?)',
-                r'(\d{1,2}\s*[ap]\.?m\.?)',
-                r'(\d{1,2}:\d{2}\s*[AP]\.?M\.?)',
-                r'(\d{1,2}\s*[AP]\.?M\.?)'
-            ]
-            
-            times = []
-            for pattern in time_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                times.extend(matches)
+            times = _TIME_RE.findall(text)
             
             if times:
                 if len(times) >= 2:
@@ -174,192 +289,108 @@ class Events12SeattleParser:
                     time_info = times[0]
             
             # Extract cost patterns
-            cost_patterns = [
-                r'\$(\d+(?:\.\d{2})?)',
-                r'(\$\d+)',
-                r'(free)',
-                r'(sold out)',
-                r'(admission[:\s]*\$?\d*)',
-                r'(no charge)',
-                r'(complimentary)'
-            ]
-            
-            for pattern in cost_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in _COST_RES:
+                match = pattern.search(text)
                 if match:
                     cost_info = match.group(0)
                     break
-            
-            # Default to free if no cost found and contains "free" keywords
-            if not cost_info and any(word in text.lower() for word in ['free', 'no charge', 'complimentary']):
-                cost_info = "Free"
         
         except Exception as e:
             print(f"Error parsing time/cost from '{text}': {e}")
         
         return time_info, cost_info
 
-    def generate_tags_from_content(self, event_text: str, title: str) -> Dict[str, List[str]]:
+    def generate_tags_from_content(self, event_text: str, title: str) -> Tags:
         """Generate tags based on event content"""
-        tags = {
-            "categories": [],
-            "demographics": [],
-            "accessibility": [],
-            "program_type": []
-        }
-        
         # Combine all text for analysis
         full_text = (title + " " + event_text).lower()
         
-        # Categories
-        category_mapping = {
-            'music': ['concert', 'music', 'band', 'symphony', 'jazz', 'blues', 'rock', 'festival'],
-            'arts': ['art', 'gallery', 'exhibit', 'artist', 'painting', 'sculpture', 'craft'],
-            'theater': ['theater', 'theatre', 'play', 'performance', 'show', 'drama'],
-            'sports': ['sports', 'game', 'race', 'run', 'marathon', 'competition'],
-            'food': ['food', 'restaurant', 'taste', 'wine', 'beer', 'dining', 'culinary'],
-            'festival': ['festival', 'fest', 'celebration', 'fair', 'carnival'],
-            'outdoor': ['park', 'outdoor', 'hiking', 'garden', 'nature', 'beach'],
-            'family': ['family', 'kids', 'children', 'child'],
-            'nightlife': ['bar', 'club', 'nightlife', 'party', 'cocktail'],
-            'education': ['class', 'workshop', 'lesson', 'learn', 'educational'],
-            'community': ['community', 'neighborhood', 'local', 'volunteer']
-        }
-        
-        for category, keywords in category_mapping.items():
-            if any(keyword in full_text for keyword in keywords):
-                tags["categories"].append(category)
-        
-        # Demographics
-        if any(word in full_text for word in ['kids', 'children', 'family', 'child']):
-            tags["demographics"].append('family')
-        if any(word in full_text for word in ['adult', '21+', 'age 21']):
-            tags["demographics"].append('adult')
-        if any(word in full_text for word in ['senior', 'elder']):
-            tags["demographics"].append('senior')
+        # Find every keyword in a single pass over the text
+        found = set()
+        for _, keyword_tags in _TAG_AUTOMATON.iter(full_text):
+            found.update(keyword_tags)
         
-        # Program type
-        if any(word in full_text for word in ['free', 'no charge', 'complimentary']):
-            tags["program_type"].append('free')
-        if '$' in full_text or 'ticket' in full_text:
-            tags["program_type"].append('ticketed')
-        if any(word in full_text for word in ['festival', 'fair', 'celebration']):
-            tags["program_type"].append('festival')
-        if any(word in full_text for word in ['outdoor', 'park']):
-            tags["program_type"].append('outdoor')
-        
-        return tags
+        return Tags(**{
+            bucket: [tag for tag in tag_keywords if (bucket, tag) in found]
+            for bucket, tag_keywords in TAG_KEYWORDS.items()
+        })
 
-    def parse_event_text(self, event_text: str) -> Dict[str, Any]:
+    def parse_event_text(self, event_text: str) -> Event:
         """Parse individual event text block into structured data"""
         lines = event_text.strip().split('\n')
         
         # Initialize event structure
-        event = {
-            "organization_name": "Events12 Seattle",
-            "program_description": "",
-            "activity_name": "",
-            "activity_description": "",
-            "location": {
-                "name": "",
-                "address": "",
-                "coordinates": {
-                    "type": "Point",
-                    "coordinates": [-122.3321, 47.6062]
-                }
-            },
-            "age_range": "",
-            "dates": {
-                "start_date": "",
-                "end_date": ""
-            },
-            "schedule": {
-                "days": [],
-                "times": ""
-            },
-            "cost": "",
-            "url": self.base_url,
-            "tags": {
-                "categories": [],
-                "demographics": [],
-                "accessibility": [],
-                "program_type": []
-            },
-            "last_updated": {
+        event = Event(
+            url=self.base_url,
+            last_updated={
                 "date": datetime.now().strftime("%Y-%m-%d"),
                 "source_url": self.base_url
             }
-        }
+        )
         
         try:
             # First line is usually the date
             if lines:
                 date_line = lines[0]
-                event["dates"] = self.parse_date_text(date_line)
+                event.dates = self.parse_date_text(date_line)
             
             # Second line is often location/neighborhood
             if len(lines) > 1:
                 location_line = lines[1]
-                event["location"] = self.parse_location_and_neighborhood(location_line)
+                event.location = self.parse_location_and_neighborhood(location_line)
             
             # Find the main event description (usually the longest line or contains event name)
             description_lines = []
             title_found = False
             
-            for i, line in enumerate(lines[2:], 2):  # Skip date and location lines
-                if line.strip():
+            for line in lines[2:]:  # Skip date and location lines
+                line = line.strip()
+                if line:
                     # Look for event title (often contains brackets or starts with description)
-                    if '[' in line and ']' in line and not title_found:
+                    if not title_found and '[' in line:
                         # Extract title from brackets
-                        title_match = re.search(r'\[([^\]]+)\]', line)
+                        title_match = _TITLE_RE.search(line)
                         if title_match:
-                            event["activity_name"] = title_match.group(1)
+                            event.activity_name = title_match.group(1)
                             title_found = True
                     
                     # Add to description
-                    description_lines.append(line.strip())
+                    description_lines.append(line)
             
             # If no bracketed title found, use first substantial line as title
-            if not event["activity_name"] and description_lines:
+            if not event.activity_name and description_lines:
                 # Look for a substantial first line as title
                 first_line = description_lines[0]
                 if len(first_line) > 10 and len(first_line) < 100:
-                    event["activity_name"] = first_line.split('.')[0]  # Take first sentence
+                    event.activity_name = first_line.split('.')[0]  # Take first sentence
             
             # Combine all description lines
             full_description = " ".join(description_lines)
-            event["activity_description"] = full_description
-            event["program_description"] = full_description
+            event.activity_description = full_description
+            event.program_description = full_description
             
             # Extract time and cost from description
             time_info, cost_info = self.parse_time_and_cost(full_description)
-            event["schedule"]["times"] = time_info
-            event["cost"] = cost_info or "Contact for pricing"
+            event.schedule.times = time_info
+            event.cost = cost_info or "Contact for pricing"
             
             # Extract age information
-            age_patterns = [
-                r'age (\d+)[+\s]',
-                r'(\d+)[+\s]',
-                r'children age (\d+)',
-                r'for age (\d+)'
-            ]
-            
-            for pattern in age_patterns:
-                match = re.search(pattern, full_description, re.IGNORECASE)
+            for pattern in _AGE_RES:
+                match = pattern.search(full_description)
                 if match:
                     age = match.group(1)
-                    event["age_range"] = f"{age}+"
+                    event.age_range = f"{age}+"
                     break
             
             # Generate tags
-            event["tags"] = self.generate_tags_from_content(full_description, event["activity_name"])
+            event.tags = self.generate_tags_from_content(full_description, event.activity_name)
             
         except Exception as e:
             print(f"Error parsing event text: {e}")
         
         return event
 
-    def parse_events_from_html(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def parse_events_from_html(self, tree: lxml.html.HtmlElement) -> List[Event]:
         """Parse events from the HTML content"""
         events = []
         
@@ -367,30 +398,35 @@ class Events12SeattleParser:
             # The Events12 page has event content in text blocks
             # We need to find patterns that separate individual events
             
-            # Get all text content
-            page_text = soup.get_text()
+            # Get all text content, leaving out scripts, styles and templates
+            for element in tree.xpath('//script|//style|//template'):
+                element.drop_tree()
+            page_text = tree.text_content()
             
-            # Split by date patterns to separate events
+            # Walk date matches to separate events
             # Events typically start with a date like "August 2, 2025"
-            date_pattern = r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\.?\s+\d{1,2}(?:\s*-\s*\d{1,2})?,?\s+\d{4})'
-            
-            # Split the text by date patterns
-            event_blocks = re.split(date_pattern, page_text)
-            
-            # Process pairs of (date, content)
-            for i in range(1, len(event_blocks), 2):
-                if i + 1 < len(event_blocks):
-                    date_text = event_blocks[i].strip()
-                    content_text = event_blocks[i + 1].strip()
-                    
+            matches = list(_EVENT_DATE_RE.finditer(page_text))
+            
+            # Process pairs of (date, content up to the next date)
+            for match, next_match in zip(matches, matches[1:] + [None]):
+                end = next_match.start() if next_match else len(page_text)
+                
+                # Skip very short content (likely not real events)
+                if end - match.end() <= 50:
+                    continue
+                
+                content_text = page_text[match.end():end].strip()
+                date_text = match.group(1).strip()
+                
+                # The name comes from the lines after the date and location lines,
+                # so a block without a third line can't produce an event
+                if len(content_text) > 50 and ('\n' in content_text or '\n' in date_text):
                     # Combine date and content
                     full_event_text = f"{date_text}\n{content_text}"
                     
-                    # Skip very short content (likely not real events)
-                    if len(content_text) > 50:
-                        event = self.parse_event_text(full_event_text)
-                        if event["activity_name"]:  # Only add if we found a name
-                            events.append(event)
+                    event = self.parse_event_text(full_event_text)
+                    if event.activity_name:  # Only add if we found a name
+                        events.append(event)
             
             print(f"Parsed {len(events)} events from HTML")
             
@@ -399,30 +435,31 @@ class Events12SeattleParser:
         
         return events
 
-    def scrape_events(self) -> List[Dict[str, Any]]:
+    def scrape_events(self) -> List[Event]:
         """Main method to scrape events from Events12 Seattle page"""
         print(f"Scraping events from: {self.base_url}")
         
-        soup = self.fetch_page_content()
-        if not soup:
+        tree = self.fetch_page_content()
+        if tree is None:
             print("Failed to fetch page content")
             return []
         
-        events = self.parse_events_from_html(soup)
+        events = self.parse_events_from_html(tree)
         
         # Clean and validate events
         valid_events = []
         for event in events:
-            if event["activity_name"] and len(event["activity_name"]) > 3:
+            if event.activity_name and len(event.activity_name) > 3:
                 valid_events.append(event)
         
         print(f"Found {len(valid_events)} valid events")
         return valid_events
 
-    def save_events_to_json(self, events: List[Dict[str, Any]], filename: str = "events12_seattle_events.json"):
+    def save_events_to_json(self, events: List[Event], filename: str = "events12_seattle_events.json"):
         """Save events to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(events, f, indent=2, ensure_ascii=False)
+        # orjson serializes the Event dataclasses directly, without building dicts first
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(events, option=orjson.OPT_INDENT_2))
         print(f"Saved {len(events)} events to {filename}")
 
 def main():
@@ -444,18 +481,18 @@ def main():
             # Show categories found
             all_categories = set()
             for event in events:
-                all_categories.update(event['tags']['categories'])
+                all_categories.update(event.tags.categories)
             print(f"Categories found: {sorted(list(all_categories))}")
             
             # Show sample event
             if events:
                 print(f"\nSample event (first):")
                 sample = events[0]
-                print(f"Name: {sample['activity_name']}")
-                print(f"Date: {sample['dates']['start_date']} to {sample['dates']['end_date']}")
-                print(f"Location: {sample['location']['name']}")
-                print(f"Cost: {sample['cost']}")
-                print(f"Categories: {', '.join(sample['tags']['categories'])}")
+                print(f"Name: {sample.activity_name}")
+                print(f"Date: {sample.dates['start_date']} to {sample.dates['end_date']}")
+                print(f"Location: {sample.location.name}")
+                print(f"Cost: {sample.cost}")
+                print(f"Categories: {', '.join(sample.tags.categories)}")
         
         else:
             print("No events found. The parsing may need adjustment for the current page structure.")
@@ -37,7 +37,8 @@ async function vectorSearch(query, limit = 10, minResults = 3, threshold = 0.75)
 		const pythonScript = path.join(__dirname, '../../vector_search.py');
 		const pythonProcess = spawn('python3', [
 			pythonScript, 
-			'--query', query, 
+			// Attach the query with '=' so queries starting with '-' aren't read as flags
+			`--query=${query}`, 
 			'--limit', limit.toString(),
 			'--min_results', minResults.toString(),
 			'--threshold', threshold.toString()
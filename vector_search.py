@@ -4,51 +4,149 @@ Vector search for RAG queries on Seattle parks opportunities.
 Given a query, finds the most similar opportunities using cosine similarity.
 """
 
+import argparse
 import json
+import functools
+import getpass
+import hashlib
+import signal
+import stat
+import socketserver
+import sys
+import tempfile
 import numpy as np
-from openai import OpenAI
-from typing import List, Dict, Any, Tuple
+import orjson
+from typing import List, Dict, Any, Tuple, Optional
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Set up OpenAI API
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Query embeddings are cached on disk so repeated searches skip the API round-trip,
+# keeping only the most recently used files
+_CACHE_OWNER = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", os.path.join(tempfile.gettempdir(), f"linkup_embedding_cache-{_CACHE_OWNER}"))
+EMBEDDING_CACHE_MAX_FILES = int(os.getenv("EMBEDDING_CACHE_MAX_FILES", "2000"))
+
+@functools.cache
+def _client():
+    """Set up the OpenAI client on first use, so cached queries never pay for it."""
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+@functools.cache
+def _embedding_cache_dir() -> Optional[str]:
+    """Create the query embedding cache directory, or return None if it isn't safe to use."""
+    try:
+        os.makedirs(EMBEDDING_CACHE_DIR, mode=0o700, exist_ok=True)
+        info = os.lstat(EMBEDDING_CACHE_DIR)
+    except OSError:
+        return None
+    
+    # Another local user could have created the directory (or a symlink) first and planted embeddings
+    if not stat.S_ISDIR(info.st_mode):
+        return None
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o022):
+        return None
+    return EMBEDDING_CACHE_DIR
+
+def _prune_embedding_cache(cache_dir: str):
+    """Delete the least recently used cached embeddings beyond EMBEDDING_CACHE_MAX_FILES."""
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".npy")]
+        if len(entries) <= EMBEDDING_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - EMBEDDING_CACHE_MAX_FILES]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Already pruned by a concurrent search
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1024)
+def _embed_query(query: str) -> Tuple[float, ...]:
+    """Embed a query, checking the in-process and on-disk caches before calling the API."""
+    cache_dir = _embedding_cache_dir()
+    if cache_dir:
+        key = hashlib.sha256(f"{EMBEDDING_MODEL}\n{query}".encode("utf-8")).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{key}.npy")
+        try:
+            embedding = np.load(cache_path)
+            os.utime(cache_path)  # Mark as recently used for pruning
+            return tuple(embedding.tolist())
+        except (OSError, ValueError):
+            pass
+    
+    response = _client().embeddings.create(
+        input=query,
+        model=EMBEDDING_MODEL
+    )
+    embedding = response.data[0].embedding
+    
+    # Write to a temporary file first so concurrent searches never read a partial file;
+    # the .tmp suffix keeps in-flight writes out of _prune_embedding_cache
+    if cache_dir:
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(embedding, dtype=np.float64))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        finally:
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
+        _prune_embedding_cache(cache_dir)
+    
+    return tuple(embedding)
 
 def generate_query_embedding(query: str) -> List[float]:
     """Generate embedding for a search query."""
     try:
-        response = client.embeddings.create(
-            input=query,
-            model="text-embedding-ada-002"
-        )
-        return response.data[0].embedding
+        return list(_embed_query(query))
     except Exception as e:
         print(f"Error generating query embedding: {e}")
         return []
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    a = np.array(a)
-    b = np.array(b)
+def build_embedding_matrix(opportunities: List[Dict[str, Any]], verbose: bool = True) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """
+    Stack opportunity embeddings into a single L2-normalized float32 matrix.
     
-    # Calculate cosine similarity
-    dot_product = np.dot(a, b)
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
+    Returns:
+        Tuple of (matrix, opportunities) where row i of the matrix is the
+        normalized embedding of opportunities[i]. Opportunities without an
+        embedding are skipped.
+    """
+    embedded = []
+    for opportunity in opportunities:
+        if 'embedding' in opportunity and opportunity['embedding']:
+            embedded.append(opportunity)
+        elif verbose:
+            print(f"⚠️  Opportunity missing embedding: {opportunity.get('activity_name', 'Unknown')}")
     
-    if norm_a == 0 or norm_b == 0:
-        return 0
+    if not embedded:
+        return np.empty((0, 0), dtype=np.float32), embedded
     
-    return dot_product / (norm_a * norm_b)
+    matrix = np.asarray([opportunity['embedding'] for opportunity in embedded], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix /= norms
+    return matrix, embedded
 
 def load_opportunities_with_embeddings(file_path: str, verbose: bool = True) -> List[Dict[str, Any]]:
     """Load opportunities with their embeddings."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            opportunities = json.load(f)
+        with open(file_path, 'rb') as f:
+            opportunities = orjson.loads(f.read())
         if verbose:
             print(f"✅ Loaded {len(opportunities)} opportunities with embeddings")
         return opportunities
@@ -57,7 +155,124 @@ def load_opportunities_with_embeddings(file_path: str, verbose: bool = True) ->
             print(f"❌ Error loading opportunities: {e}")
         return []
 
-def search_opportunities(query: str, opportunities: List[Dict[str, Any]], top_k: int = 10, min_results: int = 3, threshold: float = 0.75, verbose: bool = True) -> List[Tuple[Dict[str, Any], float]]:
+def _embedding_cache_paths(file_path: str) -> Tuple[str, str]:
+    """Paths of the metadata JSON and embedding matrix cached next to an opportunities file."""
+    base = os.path.splitext(file_path)[0]
+    return f"{base}.meta.json", f"{base}.embeddings.npy"
+
+def _write_embedding_cache(file_path: str, source_stat: os.stat_result, matrix: np.ndarray,
+                           opportunities: List[Dict[str, Any]]):
+    """Write the opportunity metadata JSON and embedding matrix cached for an opportunities file."""
+    meta_path, matrix_path = _embedding_cache_paths(file_path)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    
+    # Readable by the same users as the source, not just whoever built the cache first
+    mode = stat.S_IMODE(source_stat.st_mode) & 0o666
+    
+    # Write to temporary files first so concurrent searches never read a partial cache
+    tmp_paths = []
+    try:
+        fd, tmp_matrix_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        tmp_paths.append(tmp_matrix_path)
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, matrix)
+            f.flush()
+            matrix_stat = os.fstat(f.fileno())
+        os.chmod(tmp_matrix_path, mode)
+        
+        # Record which source and which matrix file (by inode, kept by os.replace) this metadata
+        # belongs to, so a load never pairs it with another process's matrix
+        meta = {
+            "source": {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns},
+            "matrix": {"inode": matrix_stat.st_ino, "mtime_ns": matrix_stat.st_mtime_ns},
+            "opportunities": opportunities
+        }
+        fd, tmp_meta_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        tmp_paths.append(tmp_meta_path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(meta))
+        os.chmod(tmp_meta_path, mode)
+        
+        os.replace(tmp_matrix_path, matrix_path)
+        os.replace(tmp_meta_path, meta_path)
+    finally:
+        for tmp_path in tmp_paths:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+
+def _read_embedding_cache(file_path: str) -> Optional[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+    """Read the cached matrix and metadata for an opportunities file, or None if they are missing or stale."""
+    meta_path, matrix_path = _embedding_cache_paths(file_path)
+    try:
+        with open(meta_path, 'rb') as f:
+            meta = orjson.loads(f.read())
+        source_stat = os.stat(file_path)
+        matrix_stat = os.stat(matrix_path)
+        if (meta["source"] != {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns}
+                or meta["matrix"] != {"inode": matrix_stat.st_ino, "mtime_ns": matrix_stat.st_mtime_ns}):
+            return None
+        matrix = np.load(matrix_path, mmap_mode='r')
+        opportunities = meta["opportunities"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if matrix.ndim != 2 or matrix.shape[0] != len(opportunities):
+        return None
+    return matrix, opportunities
+
+def load_embedding_index(file_path: str, verbose: bool = True) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """
+    Load the normalized embedding matrix and matching opportunities for an opportunities file.
+    
+    The first load parses the JSON and caches a metadata JSON (without embeddings) and a
+    .npy matrix next to it. Later loads memory-map the matrix instead of parsing every
+    embedding, until the source JSON changes.
+    
+    Returns:
+        Tuple of (matrix, opportunities without their embedding arrays), in matching order
+    """
+    cached = _read_embedding_cache(file_path)
+    if cached is not None:
+        if verbose:
+            print(f"✅ Loaded {len(cached[1])} opportunities with cached embeddings")
+        return cached
+    
+    try:
+        source_stat = os.stat(file_path)
+    except OSError:
+        source_stat = None
+    
+    opportunities = load_opportunities_with_embeddings(file_path, verbose)
+    matrix, embedded = build_embedding_matrix(opportunities, verbose)
+    
+    # The matrix holds the embeddings now, so match what later loads read from the cache
+    embedded = [{k: v for k, v in o.items() if k != 'embedding'} for o in embedded]
+    if embedded and source_stat:
+        try:
+            _write_embedding_cache(file_path, source_stat, matrix, embedded)
+        except OSError as e:
+            if verbose:
+                print(f"⚠️  Could not cache embeddings: {e}")
+    return matrix, embedded
+
+def _top_indices(scores: np.ndarray, count: int) -> np.ndarray:
+    """Indices of the `count` highest scores, highest first, with ties in index order."""
+    count = min(count, len(scores))
+    if count <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    if count < len(scores):
+        # Partition to find the count-th highest score, then sort only the scores at or above it
+        cutoff = np.partition(scores, len(scores) - count)[len(scores) - count]
+        candidates = np.flatnonzero(scores >= cutoff)
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:count]
+
+def search_opportunities(query: str, opportunities: List[Dict[str, Any]], top_k: int = 10, min_results: int = 3, threshold: float = 0.75, verbose: bool = True,
+                         embedding_matrix: Optional[Tuple[np.ndarray, List[Dict[str, Any]]]] = None) -> List[Tuple[Dict[str, Any], float]]:
     """
     Search for opportunities using vector similarity with dynamic threshold.
     
@@ -68,6 +283,8 @@ def search_opportunities(query: str, opportunities: List[Dict[str, Any]], top_k:
         min_results: Minimum number of results to return (even if below threshold)
         threshold: Minimum similarity score (0.0 to 1.0)
         verbose: Whether to print debug messages
+        embedding_matrix: Precomputed result of build_embedding_matrix(opportunities),
+            to reuse across searches
     
     Returns:
         List of tuples (opportunity, similarity_score) sorted by similarity
@@ -85,32 +302,35 @@ def search_opportunities(query: str, opportunities: List[Dict[str, Any]], top_k:
     if verbose:
         print(f"✅ Generated query embedding (dimension: {len(query_embedding)})")
     
-    # Calculate similarities
-    similarities = []
-    for opportunity in opportunities:
-        if 'embedding' in opportunity and opportunity['embedding']:
-            similarity = cosine_similarity(query_embedding, opportunity['embedding'])
-            similarities.append((opportunity, similarity))
-        else:
-            if verbose:
-                print(f"⚠️  Opportunity missing embedding: {opportunity.get('activity_name', 'Unknown')}")
+    if embedding_matrix is None:
+        embedding_matrix = build_embedding_matrix(opportunities, verbose)
+    matrix, embedded = embedding_matrix
     
-    # Sort by similarity (highest first)
-    similarities.sort(key=lambda x: x[1], reverse=True)
+    # Calculate cosine similarities against every opportunity at once
+    if embedded:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vector)
+        if query_norm > 0:
+            query_vector /= query_norm
+        scores = matrix @ query_vector
+    else:
+        scores = np.empty(0, dtype=np.float32)
     
     # Apply dynamic threshold logic
-    # First, get all results above threshold
-    above_threshold = [(opp, sim) for opp, sim in similarities if sim >= threshold]
+    # Results above threshold are a prefix of the ranking, so only count them
+    # (in float64, as the returned scores are compared against the threshold)
+    above_threshold = int(np.count_nonzero(scores.astype(np.float64) >= threshold))
     
-    # If we have enough results above threshold, use them (up to top_k)
-    if len(above_threshold) >= min_results:
-        results = above_threshold[:top_k]
-        if verbose:
+    # If we have enough results above threshold, use them (up to top_k);
+    # otherwise take top min_results regardless of threshold
+    enough_above_threshold = above_threshold >= min_results
+    count = min(top_k, above_threshold) if enough_above_threshold else min_results
+    results = [(embedded[i], float(scores[i])) for i in _top_indices(scores, count)]
+    
+    if verbose:
+        if enough_above_threshold:
             print(f"🎯 Found {len(results)} results above threshold {threshold:.2f}")
-    else:
-        # If not enough above threshold, take top min_results regardless of threshold
-        results = similarities[:max(min_results, len(above_threshold))]
-        if verbose:
+        else:
             print(f"🎯 Found {len(results)} results (threshold {threshold:.2f} too restrictive, showing top {len(results)})")
     
     # Show similarity range for debugging
@@ -138,7 +358,7 @@ def interactive_search():
     """Interactive search interface."""
     # Load opportunities
     file_path = "/Users/yaoderek/Documents/vscode/youthconnectorhack/data/agent_outputs/seattle_parks_opportunities_with_embeddings.json"
-    opportunities = load_opportunities_with_embeddings(file_path)
+    matrix, opportunities = load_embedding_index(file_path)
     
     if not opportunities:
         print("❌ No opportunities loaded. Exiting.")
@@ -165,7 +385,8 @@ def interactive_search():
             continue
         
         # Search for opportunities
-        results = search_opportunities(query, opportunities, top_k=5, min_results=3, threshold=0.75)
+        results = search_opportunities(query, opportunities, top_k=5, min_results=3, threshold=0.75,
+                                       embedding_matrix=(matrix, opportunities))
         
         if not results:
             print("❌ No results found.")
@@ -195,62 +416,93 @@ def search_function(query: str, top_k: int = 10, min_results: int = 3, threshold
         List of opportunity dictionaries sorted by similarity
     """
     file_path = "/Users/yaoderek/Documents/vscode/youthconnectorhack/data/agent_outputs/seattle_parks_opportunities_with_embeddings.json"
-    opportunities = load_opportunities_with_embeddings(file_path, verbose)
+    matrix, opportunities = load_embedding_index(file_path, verbose)
     
     if not opportunities:
         return []
     
-    results = search_opportunities(query, opportunities, top_k, min_results, threshold, verbose)
+    results = search_opportunities(query, opportunities, top_k, min_results, threshold, verbose,
+                                   embedding_matrix=(matrix, opportunities))
     return [opportunity for opportunity, similarity in results]
 
+def format_api_results(results: List[Tuple[Dict[str, Any], float]]) -> List[Dict[str, Any]]:
+    """Format search results for the API: include both opportunity and similarity score."""
+    return [{"opportunity": opportunity, "similarity": similarity} for opportunity, similarity in results]
+
+class SearchRequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON search requests against the index loaded by serve()."""
+    
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                results = search_opportunities(request["query"], self.server.opportunities,
+                                               int(request.get("limit", 10)),
+                                               int(request.get("min_results", 3)),
+                                               float(request.get("threshold", 0.75)),
+                                               verbose=False, embedding_matrix=self.server.embedding_matrix)
+                response = format_api_results(results)
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+def serve(socket_path: str, file_path: str):
+    """
+    Serve searches over a Unix socket so callers skip Python startup and index loading per query.
+    
+    Each request is one JSON line such as {"query": "swim lessons", "limit": 10}, and each
+    response is one JSON line in the same format as the --query output.
+    """
+    # Replace a stale socket from an earlier run, but never any other kind of file
+    try:
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            sys.exit(f"❌ {socket_path} already exists and is not a socket")
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    
+    matrix, opportunities = load_embedding_index(file_path, verbose=False)
+    
+    # Exit through the finally below on SIGTERM too, so the socket is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    with socketserver.ThreadingUnixStreamServer(socket_path, SearchRequestHandler) as server:
+        server.opportunities = opportunities
+        server.embedding_matrix = (matrix, opportunities)
+        print(f"🔍 Serving vector search on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
 if __name__ == "__main__":
-    import sys
+    parser = argparse.ArgumentParser(description="Vector search over Seattle parks opportunities.")
+    parser.add_argument("--query", help="search query; prints matching opportunities as JSON")
+    parser.add_argument("--limit", type=int, default=10, help="maximum number of results")
+    parser.add_argument("--min_results", type=int, default=3, help="minimum number of results, even below threshold")
+    parser.add_argument("--threshold", type=float, default=0.75, help="minimum similarity score")
+    parser.add_argument("--serve", metavar="SOCKET_PATH", help="serve JSON-line search requests on a Unix socket")
     
     # Check if command line arguments are provided (for Express.js integration)
     if len(sys.argv) > 1:
-        # Parse command line arguments
-        query = None
-        limit = 10
-        min_results = 3
-        threshold = 0.75
-        
-        i = 1
-        while i < len(sys.argv):
-            if sys.argv[i] == '--query' and i + 1 < len(sys.argv):
-                query = sys.argv[i + 1]
-                i += 2
-            elif sys.argv[i] == '--limit' and i + 1 < len(sys.argv):
-                limit = int(sys.argv[i + 1])
-                i += 2
-            elif sys.argv[i] == '--min_results' and i + 1 < len(sys.argv):
-                min_results = int(sys.argv[i + 1])
-                i += 2
-            elif sys.argv[i] == '--threshold' and i + 1 < len(sys.argv):
-                threshold = float(sys.argv[i + 1])
-                i += 2
-            else:
-                i += 1
+        args = parser.parse_args()
+        file_path = "data/agent_outputs/seattle_parks_opportunities_with_embeddings.json"
         
-        if query:
+        if args.serve:
+            serve(args.serve, file_path)
+        elif args.query:
             # Run search and output JSON for Express.js (non-verbose mode)
             # Get the raw results with similarity scores
-            file_path = "data/agent_outputs/seattle_parks_opportunities_with_embeddings.json"
-            opportunities = load_opportunities_with_embeddings(file_path, verbose=False)
+            matrix, opportunities = load_embedding_index(file_path, verbose=False)
             
             if opportunities:
-                search_results = search_opportunities(query, opportunities, limit, min_results, threshold, verbose=False)
-                # Format for API: include both opportunity and similarity score
-                formatted_results = []
-                for opportunity, similarity in search_results:
-                    formatted_results.append({
-                        "opportunity": opportunity,
-                        "similarity": similarity
-                    })
-                print(json.dumps(formatted_results))
+                search_results = search_opportunities(args.query, opportunities, args.limit, args.min_results, args.threshold, verbose=False,
+                                                      embedding_matrix=(matrix, opportunities))
+                print(json.dumps(format_api_results(search_results)))
             else:
                 print(json.dumps([]))
         else:
-            print("Usage: python3 vector_search.py --query 'search term' [--limit 10] [--min_results 3] [--threshold 0.75]")
+            parser.print_usage()
             sys.exit(1)
     else:
         # Run interactive search